@@ -47,8 +47,8 @@ options:
       description:
       - List of Initiator WWN or IQN or NQN to be added or removed from the
         host.
-      - Subordinate initiators in a host can only be of one type, either FC or
-        iSCSI.
+      - Subordinate initiators in a host can only be of one type, either FC,
+        iSCSI or NVMe.
       - Required when creating a host.
       - It is mutually exclusive with I(detailed_initiators).
       type: list
@@ -375,33 +375,56 @@ VERSION_ERROR = py4ps_version['unsupported_version_message']
 # Application type
 APPLICATION_TYPE = 'Ansible/3.3.0'
 
-# DO NOT CHANGE BELOW PORT_TYPES SEQUENCE AS ITS USED IN SCRIPT USING INDEX
-PORT_TYPES = ["iSCSI", "FC", "NVMe"]
+# DO NOT CHANGE BELOW PORT_TYPES SEQUENCE AS ITS UNPACKED INTO THE NAMES BELOW
+PORT_TYPES = ("iSCSI", "FC", "NVMe")
+ISCSI, FC, NVME = PORT_TYPES
+
+# Port type of an initiator by the prefix of its name, FC otherwise
+_PORT_TYPE_BY_PREFIX = {'iqn': ISCSI, 'nqn': NVME}
+
+# Port types which do not support CHAP authentication
+_CHAP_UNSUPPORTED_PORT_TYPES = frozenset((FC, NVME))
+
+_CHAP_KEYS = ('chap_single_username', 'chap_single_password',
+              'chap_mutual_username', 'chap_mutual_password')
+_CHAP_PASSWORD_KEYS = ('chap_single_password', 'chap_mutual_password')
+
+# Error messages of the playbook parameter checks
+_ERR_INITIATORS_REQUIRED = "initiators or detailed_initiators are " \
+                           "mandatory along with initiator_state. Please " \
+                           "provide a valid value."
+_ERR_INIT_STATE_REQUIRED = "initiator_state is mandatory along with " \
+                           "initiators or detailed_initiators. Please " \
+                           "provide a valid value."
+_ERR_OS_TYPE_MODIFY = "os_type cannot be modified for an already existing" \
+                      " host."
+_ERR_NEW_NAME_NO_HOST = "Operation on host failed as new_name is given " \
+                        "for a host that doesnt exist."
+_ERR_BAD_INIT_STATE = "Incorrect initiator_state specified for Create" \
+                      " host functionality"
 
 
 class PowerStoreHost(object):
     '''Class with host(initiator group) operations'''
 
+    __slots__ = ('module_params', 'module', 'result', 'conn')
+
     def __init__(self):
         # Define all parameters required by this module
-        self.module_params = utils.get_powerstore_management_host_parameters()
-        self.module_params.update(get_powerstore_host_parameters())
-        mutually_exclusive = [['host_name', 'host_id'],
-                              ['initiators', 'detailed_initiators']]
-        required_one_of = [['host_name', 'host_id']]
+        self.module_params = _MODULE_PARAMS
         # Initialize the Ansible module
         self.module = AnsibleModule(
             argument_spec=self.module_params,
             supports_check_mode=False,
-            mutually_exclusive=mutually_exclusive,
-            required_one_of=required_one_of
+            mutually_exclusive=MUTUALLY_EXCLUSIVE,
+            required_one_of=REQUIRED_ONE_OF
         )
 
-        LOG.info(
+        LOG.debug(
             'HAS_PY4PS = %s , IMPORT_ERROR = %s', HAS_PY4PS, IMPORT_ERROR)
         if HAS_PY4PS is False:
             self.module.fail_json(msg=IMPORT_ERROR)
-        LOG.info(
+        LOG.debug(
             'IS_SUPPORTED_PY4PS_VERSION = %s , VERSION_ERROR = %s',
             IS_SUPPORTED_PY4PS_VERSION, VERSION_ERROR)
         if IS_SUPPORTED_PY4PS_VERSION is False:
@@ -412,7 +435,7 @@ class PowerStoreHost(object):
 
         self.conn = utils.get_powerstore_connection(
             self.module.params, application_type=APPLICATION_TYPE)
-        LOG.info(
+        LOG.debug(
             'Got Python library connection instance for provisioning on'
             ' PowerStore %s', self.conn)
 
@@ -421,7 +444,7 @@ class PowerStoreHost(object):
         Get details of a given host, given host ID
         '''
         try:
-            LOG.info('Getting host %s details', host_id)
+            LOG.debug('Getting host %s details', host_id)
             host_from_get = self.conn.provisioning.get_host_details(host_id)
             if host_from_get:
                 return host_from_get
@@ -429,18 +452,19 @@ class PowerStoreHost(object):
         except Exception as e:
             error_msg = 'Unable to get details of host with ID: {0}' \
                         ' -- error: {1}'.format(host_id, str(e))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+            self._fail(error_msg, **utils.failure_codes(e))
 
-    def get_host_id_by_name(self, host_name):
+    def get_host_by_name(self, host_name):
+        '''
+        Get details of a given host, given host name
+        '''
         try:
             host_info = self.conn.provisioning.get_host_by_name(host_name)
             if host_info:
                 if len(host_info) > 1:
                     error_msg = 'Multiple hosts by the same name found'
-                    LOG.error(error_msg)
-                    self.module.fail_json(msg=error_msg)
-                return host_info[0]['id']
+                    self._fail(error_msg)
+                return host_info[0]
         except Exception as e:
             msg = 'Get Host {0} Details for powerstore array failed with ' \
                   'error: {1}'.format(host_name, str(e))
@@ -449,53 +473,38 @@ class PowerStoreHost(object):
                     and e.status_code == "404":
                 LOG.info(msg)
                 return None
-            LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
+            self._fail(msg, **utils.failure_codes(e))
 
-    def create_host(self, host_name):
+    def create_host(self, host_name, os_type, initiators=None,
+                    detailed_initiators=None, host_connectivity=None):
         '''
-        Create host with given initiators
+        Create host with given initiators and return its ID
         '''
         try:
-            initiators = self.module.params['initiators']
-            detailed_initiators = self.module.params['detailed_initiators']
-            host_connectivity = self.module.params['host_connectivity']
-
-            os_type = self.module.params['os_type']
             if os_type is None:
                 error_msg = "Create host {0} failed as os_type is not " \
                             "specified".format(host_name)
-                LOG.error(error_msg)
-                self.module.fail_json(msg=error_msg)
+                self._fail(error_msg)
 
             if initiators:
-                list_of_initiators = []
-                initiator_type = []
+                # initiators of a host can only be of one type
+                seen_types = set()
                 for initiator in initiators:
-                    current_initiator = {}
-                    current_initiator['port_name'] = initiator
-                    if initiator.startswith('iqn'):
-                        current_initiator['port_type'] = PORT_TYPES[0]  # iSCSI
-                        initiator_type.append(PORT_TYPES[0])
-                    elif initiator.startswith('nqn'):
-                        current_initiator['port_type'] = PORT_TYPES[2]  # NVMe
-                        initiator_type.append(PORT_TYPES[2])
-                    else:
-                        current_initiator['port_type'] = PORT_TYPES[1]  # FC
-                        initiator_type.append(PORT_TYPES[1])
-                    list_of_initiators.append(current_initiator)
-
-                if 'iSCSI' in initiator_type and 'FC' in initiator_type \
-                        and 'NVMe' in initiator_type:
-                    error_msg = ('Invalid initiators. Cannot add IQN, WWN and'
-                                 ' NQN as part of host. Connect either fiber '
-                                 'channel or iSCSI or NVMe.'
-                                 )
-                    LOG.error(error_msg)
-                    self.module.fail_json(msg=error_msg)
-
-                LOG.info("Creating host %s with initiators %s", host_name,
-                         list_of_initiators)
+                    seen_types.add(_classify_port(initiator))
+                    if len(seen_types) > 1:
+                        error_msg = ('Invalid initiators. Cannot add a mix of'
+                                     ' IQN, WWN and NQN as part of host. '
+                                     'Connect either fiber channel or iSCSI '
+                                     'or NVMe.'
+                                     )
+                        self._fail(error_msg)
+
+                list_of_initiators = [
+                    {'port_name': initiator,
+                     'port_type': _classify_port(initiator)}
+                    for initiator in initiators]
+                LOG.debug("Creating host %s with initiators %s", host_name,
+                          list_of_initiators)
                 resp = self.conn.provisioning.create_host(
                     name=host_name, os_type=os_type,
                     initiators=list_of_initiators,
@@ -503,185 +512,129 @@ class PowerStoreHost(object):
             else:
                 for initiator in detailed_initiators:
                     if initiator['port_type'] is None:
-                        if initiator['port_name'].startswith('iqn'):
-                            initiator['port_type'] = PORT_TYPES[0]  # iSCSI
-                        elif initiator['port_name'].startswith('nqn'):
-                            initiator['port_type'] = PORT_TYPES[2]  # NVMe
-                        else:
-                            initiator['port_type'] = PORT_TYPES[1]  # FC
-
-                LOG.info("Creating host %s with initiators %s", host_name,
-                         detailed_initiators)
+                        initiator['port_type'] = _classify_port(
+                            initiator['port_name'])
+
+                LOG.debug("Creating host %s with initiators %s", host_name,
+                          detailed_initiators)
                 resp = self.conn.provisioning.create_host(
                     name=host_name, os_type=os_type,
                     initiators=detailed_initiators,
                     host_connectivity=host_connectivity)
-            LOG.info("The response is %s", resp)
-            return True
+            LOG.debug("The response is %s", resp)
+            return resp['id']
 
         except Exception as e:
             error_msg = 'Create host {0} failed with error {1}'.format(
                 host_name, str(e))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+            self._fail(error_msg, **utils.failure_codes(e))
         return None
 
-    def _get_add_initiators(self, existing, requested):
-        all_inits = existing + requested
-        add_inits = list(set(all_inits) - set(existing))
-        return add_inits
-
-    def _get_remove_initiators(self, existing, requested):
-        rem_inits = list(set(existing).intersection(set(requested)))
-        return rem_inits
-
-    def add_host_initiators(self, host):
-        initiators = self.module.params['initiators']
-        detailed_initiators = self.module.params['detailed_initiators']
-        add_list = None
-
-        try:
-            existing_inits = []
-            if 'host_initiators' in host:
-                current_initiators = host['host_initiators']
-                if current_initiators:
-                    for initiator in current_initiators:
-                        existing_inits.append(initiator['port_name'])
-
-            if initiators \
-               and (set(initiators).issubset(set(existing_inits))):
-                LOG.info('Initiators are already present in host %s',
-                         host['name'])
-                return False
-
-            initiator_list = []
-            if detailed_initiators is not None:
-                initiator_list = [p_name['port_name'] for p_name in
-                                  detailed_initiators]
-
-            if detailed_initiators and \
-                    (set(initiator_list).issubset(set(existing_inits))):
-                LOG.info('Initiators are already present in host %s',
-                         host['name'])
-                return False
-
-            if detailed_initiators:
-                initiators = []
-                for initiator in detailed_initiators:
-                    initiators.append(initiator['port_name'])
-
-            add_list = self._get_add_initiators(existing_inits, initiators)
-            add_list_with_type = []
-            for init in add_list:
-                # when detailed_initiators param is used to add new initiators
-                if detailed_initiators:
-                    for detailed_init in detailed_initiators:
-                        if init == detailed_init['port_name']:
-                            current_initiator = {}
-                            current_initiator['port_name'] = init
-                            # iSCSI
-                            if init.startswith('iqn'):
-                                current_initiator['port_type'] = PORT_TYPES[0]
-                                current_initiator['chap_single_username'] \
-                                    = detailed_init['chap_single_username']
-                                current_initiator['chap_single_password'] \
-                                    = detailed_init['chap_single_password']
-                                current_initiator['chap_mutual_username'] \
-                                    = detailed_init['chap_mutual_username']
-                                current_initiator['chap_mutual_password'] \
-                                    = detailed_init['chap_mutual_password']
-                            # NVMe
-                            elif init.startswith('nqn'):
-                                current_initiator['port_type'] = PORT_TYPES[2]
-                            # FC
-                            else:
-                                current_initiator['port_type'] = PORT_TYPES[1]
-                            add_list_with_type.append(current_initiator)
-                # when initiators param is used to add new initiators
-                else:
-                    current_initiator = {}
-                    current_initiator['port_name'] = init
-                    # iSCSI
-                    if init.startswith('iqn'):
-                        current_initiator['port_type'] = PORT_TYPES[0]
-                    # NVMe
-                    elif init.startswith('nqn'):
-                        current_initiator['port_type'] = PORT_TYPES[2]
-                    # FC
-                    else:
-                        current_initiator['port_type'] = PORT_TYPES[1]
-                    add_list_with_type.append(current_initiator)
-
-            if len(add_list_with_type) > 0:
-
-                LOG.info('Adding initiators %s to host %s',
-                         add_list_with_type, host['name'])
-                resp = self.conn.provisioning.modify_host(
-                    host['id'], add_initiators=add_list_with_type)
-                LOG.info('Response from add initiator function %s', resp)
-                return True
-            else:
-                LOG.info('No initiators to add to host %s', host['name'])
-                return False
-        except Exception as e:
-            error_msg = ("Adding initiators {0} to host {1} failed with error"
-                         " {2}".format(add_list, host['name'], str(e)))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
-
-    def remove_host_initiators(self, host):
-        initiators = self.module.params['initiators']
-        detailed_initiators = self.module.params['detailed_initiators']
-        remove_list = None
-        try:
-
-            existing_inits = []
-            current_initiators = host['host_initiators']
-
-            if current_initiators:
-                for initiator in current_initiators:
-                    existing_inits.append(initiator['port_name'])
-
-            if len(existing_inits) == 0:
-                LOG.info('No initiators are present in host %s', host['name'])
-                return False
-
-            if detailed_initiators:
-                initiators = []
-                for initiator in detailed_initiators:
-                    initiators.append(initiator['port_name'])
+    @staticmethod
+    def _requested_names(initiators, detailed_initiators):
+        '''
+        Get the port names of the initiators given in playbook
+        '''
+        if detailed_initiators:
+            return frozenset(initiator['port_name'] for initiator
+                             in detailed_initiators)
+        return frozenset(initiators or ())
 
-            remove_list = self._get_remove_initiators(existing_inits,
-                                                      initiators)
+    @staticmethod
+    def _existing_names(host):
+        '''
+        Get the port names of the initiators already present in host
+        '''
+        return frozenset(initiator['port_name'] for initiator in
+                         host.get('host_initiators') or ())
 
-            if len(remove_list) > 0:
+    def add_host_initiators(self, host, existing_inits, initiators,
+                            detailed_initiators):
+        '''
+        Get the initiators to be added to host, as modify_host arguments
+        '''
+        add_list = list(self._requested_names(
+            initiators, detailed_initiators) - existing_inits)
+        if not add_list:
+            LOG.info('Initiators are already present in host %s',
+                     host['name'])
+            return {}
+
+        detailed_by_name = {
+            detailed_init['port_name']: detailed_init
+            for detailed_init in detailed_initiators
+        } if detailed_initiators else None
+
+        add_list_with_type = []
+        for init in add_list:
+            current_initiator = {
+                'port_name': init,
+                'port_type': _classify_port(init)
+            }
+            # when detailed_initiators param is used to add new iSCSI
+            # initiators, pass on their CHAP credentials
+            if detailed_by_name and \
+                    current_initiator['port_type'] == ISCSI:
+                detailed_init = detailed_by_name[init]
+                for chap_key in _CHAP_KEYS:
+                    current_initiator[chap_key] = detailed_init[chap_key]
+            add_list_with_type.append(current_initiator)
+
+        LOG.debug('Initiators %s to be added to host %s',
+                  add_list_with_type, host['name'])
+        return {'add_initiators': add_list_with_type}
+
+    def remove_host_initiators(self, host, existing_inits, initiators,
+                               detailed_initiators):
+        '''
+        Get the initiators to be removed from host, as modify_host arguments
+        '''
+        remove_list = list(self._requested_names(
+            initiators, detailed_initiators) & existing_inits)
+        if not remove_list:
+            LOG.info('No initiators to remove from host %s', host['name'])
+            return {}
 
-                LOG.info('Removing initiators %s from host %s', remove_list,
-                         host['name'])
-                resp = self.conn.provisioning.modify_host(
-                    host['id'], remove_initiators=remove_list)
-                LOG.info('Response from remove initiator function %s', resp)
-                return True
-            else:
-                LOG.info('No initiators to remove from host %s', host['name'])
-                return False
-        except Exception as e:
-            error_msg = (("Removing initiators {0} from host {1} failed"
-                          "with error {2}").format(
-                remove_list, host['name'], str(e)))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+        LOG.debug('Initiators %s to be removed from host %s', remove_list,
+                  host['name'])
+        return {'remove_initiators': remove_list}
 
     def update_host(self, host, new_name=None, host_connectivity=None):
+        '''
+        Get the name and connectivity changes of host, as modify_host
+        arguments
+        '''
+        host_changes = {}
+        if new_name is not None and host['name'] != new_name:
+            host_changes['name'] = new_name
+        if host_connectivity is not None and \
+                host['host_connectivity'] != host_connectivity:
+            host_changes['host_connectivity'] = host_connectivity
+        return host_changes
+
+    def apply_host_changes(self, host, **host_changes):
+        '''
+        Apply initiator, name and connectivity changes to host with a single
+        modify call
+        '''
+        host_changes = {key: value for key, value in host_changes.items()
+                        if value}
+        if not host_changes:
+            return False
         try:
-            self.conn.provisioning.modify_host(
-                host['id'], name=new_name, host_connectivity=host_connectivity)
+            LOG.info('Modifying host %s', host['name'])
+            LOG.debug('Host %s changes %s', host['name'],
+                      _without_chap_passwords(host_changes))
+            resp = self.conn.provisioning.modify_host(host['id'],
+                                                      **host_changes)
+            LOG.debug('Response from modify host function %s', resp)
             return True
         except Exception as e:
-            error_msg = 'Renaming of host {0} failed with error {1}'.format(
-                host['name'], str(e))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+            error_msg = 'Modifying host {0} with changes {1} failed with ' \
+                        'error {2}'.format(
+                            host['name'],
+                            _without_chap_passwords(host_changes), str(e))
+            self._fail(error_msg, **utils.failure_codes(e))
 
     def delete_host(self, host):
         '''
@@ -693,174 +646,226 @@ class PowerStoreHost(object):
         except Exception as e:
             error_msg = ('Delete host {0} failed with error {1}'.format(
                 host['name'], str(e)))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+            self._fail(error_msg, **utils.failure_codes(e))
 
     def validate_initiators(self, detailed_initiators):
-        for initiator in detailed_initiators:
+        port_names = [initiator['port_name'] for initiator
+                      in detailed_initiators]
+        if len(port_names) != len(set(port_names)):
+            error_msg = "Duplicate port_name found in detailed_initiators. " \
+                        "Please provide each initiator only once."
+            self._fail(error_msg)
+
+        chap_port_types = (
+            initiator['port_type'] for initiator in detailed_initiators
             if (initiator['chap_single_username']
-                    or initiator['chap_mutual_username']):
-                if initiator['port_type'] == PORT_TYPES[1]:  # FC
-                    error_msg = "CHAP authentication is not supported " \
-                                "for FC initiator type."
-                    LOG.error(error_msg)
-                    self.module.fail_json(msg=error_msg)
-                elif initiator['port_type'] == PORT_TYPES[2]:  # NVMe
-                    error_msg = "CHAP authentication is not supported " \
-                                "for NVMe initiator type."
-                    LOG.error(error_msg)
-                    self.module.fail_json(msg=error_msg)
-
-    def _create_result_dict(self, changed, host_id):
+                or initiator['chap_mutual_username']))
+        unsupported_type = next((port_type for port_type in chap_port_types
+                                 if port_type in _CHAP_UNSUPPORTED_PORT_TYPES),
+                                None)
+        if unsupported_type:
+            error_msg = "CHAP authentication is not supported " \
+                        "for {0} initiator type.".format(unsupported_type)
+            self._fail(error_msg)
+
+    def _fail(self, error_msg, **kwargs):
+        '''
+        Log the error and fail the module with it
+        '''
+        LOG.error(error_msg)
+        self.module.fail_json(msg=error_msg, **kwargs)
+
+    def _create_result_dict(self, state, changed, host_id,
+                            current_host=None):
         self.result['changed'] = changed
-        if self.module.params['state'] == 'absent':
-            self.result['host_details'] = dict()
+        if state == 'absent':
+            # host_details stays empty as initialized in __init__
+            return
+        if not changed and current_host is not None:
+            self.result['host_details'] = current_host
         else:
             self.result['host_details'] = self.get_host(host_id)
 
+    def _handle_create(self, host_name, host_id, os_type, initiator_state,
+                       initiators, detailed_initiators, host_connectivity):
+        '''
+        Create the host when it does not exist
+        '''
+        if not host_name:
+            return False, host_id
+
+        if initiator_state != "present-in-host":
+            self._fail(_ERR_BAD_INIT_STATE)
+        LOG.info('Creating host %s', host_name)
+        host_id = self.create_host(
+            host_name, os_type, initiators=initiators,
+            detailed_initiators=detailed_initiators,
+            host_connectivity=host_connectivity)
+        return host_id is not None, host_id
+
+    def _handle_modify(self, host, initiator_state, initiators,
+                       detailed_initiators, new_name, host_connectivity):
+        '''
+        Bring initiators, name and connectivity of an existing host in line
+        with the playbook
+        '''
+        initiator_handlers = {
+            'present-in-host': self.add_host_initiators,
+            'absent-in-host': self.remove_host_initiators
+        }
+        host_changes = {}
+        if (initiators or detailed_initiators) \
+                and initiator_state in initiator_handlers:
+            LOG.debug('Updating initiators of host %s', host['id'])
+            host_changes.update(initiator_handlers[initiator_state](
+                host, self._existing_names(host), initiators,
+                detailed_initiators))
+
+        host_changes.update(self.update_host(
+            host=host, new_name=new_name,
+            host_connectivity=host_connectivity))
+
+        return self.apply_host_changes(host, **host_changes), host['id']
+
+    def _handle_delete(self, host):
+        '''
+        Delete the existing host
+        '''
+        LOG.info('Delete host %s ', host['name'])
+        return self.delete_host(host), host['id']
+
     def perform_module_operation(self):
         '''
         Perform different actions on host based on user parameter
         chosen in playbook
         '''
-        state = self.module.params['state']
-        initiator_state = self.module.params['initiator_state']
-        host_name = self.module.params['host_name']
-        host_id = self.module.params['host_id']
-        initiators = self.module.params['initiators']
-        detailed_initiators = self.module.params['detailed_initiators']
-        new_name = self.module.params['new_name']
-        os_type = self.module.params['os_type']
-        host_connectivity = self.module.params['host_connectivity']
+        params = self.module.params
+        state = params['state']
+        initiator_state = params['initiator_state']
+        host_name = params['host_name']
+        host_id = params['host_id']
+        initiators = params['initiators']
+        detailed_initiators = params['detailed_initiators']
+        os_type = params['os_type']
+        new_name = params['new_name']
+        host_connectivity = params['host_connectivity']
+
+        if initiators:
+            # drop repeated initiators, keeping the order given in playbook
+            initiators = list(dict.fromkeys(initiators))
 
         if host_name:
-            host_id = self.get_host_id_by_name(host_name)
-        if host_id:
+            host = self.get_host_by_name(host_name)
+        elif host_id:
             host = self.get_host(host_id)
-            host_name = host['name']
         else:
             host = None
-        changed = False
-
-        if initiator_state and ((initiators is None or not len(initiators))
-                                and (detailed_initiators is None
-                                     or not len(detailed_initiators))):
-            error_msg = "initiators or detailed_initiators are " \
-                        "mandatory along with initiator_state. Please " \
-                        "provide a valid value."
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg)
-        if (initiators or detailed_initiators) and initiator_state is None:
-            error_msg = "initiator_state is mandatory along with " \
-                        "initiators or detailed_initiators. Please " \
-                        "provide a valid value."
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg)
+        if host:
+            host_id = host['id']
+            host_name = host['name']
+        elif state == 'absent':
+            # host is already absent, nothing to do
+            self._create_result_dict(state, False, None)
+            self.module.exit_json(**self.result)
+            return
+
+        # fail fast on requests which cannot apply to the host, before
+        # anything is changed on the array
+        if host and os_type and os_type != host["os_type"]:
+            self._fail(_ERR_OS_TYPE_MODIFY)
+        if not host and host_name and new_name:
+            self._fail(_ERR_NEW_NAME_NO_HOST)
+
+        if initiator_state and not initiators and not detailed_initiators:
+            self._fail(_ERR_INITIATORS_REQUIRED)
+        if (initiators or detailed_initiators) and not initiator_state:
+            self._fail(_ERR_INIT_STATE_REQUIRED)
 
         # validate detailed initiators dict
         if detailed_initiators and initiator_state is not None:
             self.validate_initiators(detailed_initiators)
 
-        if state == 'present' and not host and host_name:
-            if self.module.params['new_name']:
-                error_msg = "Operation on host failed as new_name is given " \
-                            "for a host that doesnt exist."
-                LOG.error(error_msg)
-                self.module.fail_json(msg=error_msg)
-
-            if initiator_state != "present-in-host":
-                error_msg = "Incorrect initiator_state specified for Create" \
-                            " host functionality"
-                LOG.error(error_msg)
-                self.module.fail_json(msg=error_msg)
-            LOG.info('Creating host %s', host_name)
-            changed = self.create_host(host_name)
-            if changed:
-                host_id = self.get_host_id_by_name(host_name)
-
-        if host and os_type and os_type != host["os_type"]:
-            error_msg = "os_type cannot be modified for an already existing" \
-                        " host."
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg)
-
-        if (state == 'present' and host
-                and initiator_state == 'present-in-host'
-                and (initiators or detailed_initiators)):
-            LOG.info('Adding initiators to host %s', host_id)
-            changed = (self.add_host_initiators(host) or changed)
-
-        if (state == 'present' and host
-                and initiator_state == 'absent-in-host'
-                and (initiators or detailed_initiators)):
-            LOG.info('Removing initiators from host %s', host_id)
-            changed = (self.remove_host_initiators(host) or changed)
-
-        if state == 'present' and host and (new_name or host_connectivity):
-            modify_flag = is_modify_required(host, new_name, host_connectivity)
-            if modify_flag:
-                changed = self.update_host(host=host, new_name=new_name,
-                                           host_connectivity=host_connectivity)
-
-        if state == 'absent' and host:
-            LOG.info('Delete host %s ', host['name'])
-            changed = self.delete_host(host) or changed
-
-        self._create_result_dict(changed, host_id)
+        # handler for the requested state, by whether the host exists; an
+        # absent host with state absent has already been handled above
+        state_handlers = {
+            ('present', False): lambda: self._handle_create(
+                host_name, host_id, os_type, initiator_state, initiators,
+                detailed_initiators, host_connectivity),
+            ('present', True): lambda: self._handle_modify(
+                host, initiator_state, initiators, detailed_initiators,
+                new_name, host_connectivity),
+            ('absent', True): lambda: self._handle_delete(host)
+        }
+        changed, host_id = state_handlers[(state, bool(host))]()
+
+        self._create_result_dict(state, changed, host_id, host)
         # Update the module's final state
         LOG.info('changed %s', changed)
         self.module.exit_json(**self.result)
 
 
-def is_modify_required(host, new_name, host_connectivity):
-    """ Check whether modification for host is required or not."""
-
-    modify_flag = False
-    if new_name is not None and host['name'] != new_name:
-        modify_flag = True
-    if host_connectivity is not None and \
-            host['host_connectivity'] != host_connectivity:
-        modify_flag = True
-    return modify_flag
+def _classify_port(port_name):
+    """ Get the port type of an initiator from the prefix of its name."""
+    return _PORT_TYPE_BY_PREFIX.get(port_name[:3].lower(), FC)
+
+
+def _without_chap_passwords(host_changes):
+    """ Get modify_host arguments with CHAP passwords of added initiators
+    left out, for logging."""
+    if not host_changes.get('add_initiators'):
+        return host_changes
+    return dict(host_changes, add_initiators=[
+        {key: value for key, value in initiator.items()
+         if key not in _CHAP_PASSWORD_KEYS}
+        for initiator in host_changes['add_initiators']])
+
+
+_HOST_ARGSPEC = {
+    'host_name': {'required': False, 'type': 'str'},
+    'host_id': {'required': False, 'type': 'str'},
+    'initiators': {'required': False, 'type': 'list', 'elements': 'str'},
+    'detailed_initiators': {
+        'type': 'list', 'required': False, 'elements': 'dict',
+        'options': {
+            'port_name': {'type': 'str', 'required': True},
+            'port_type': {'type': 'str', 'required': False,
+                          'choices': PORT_TYPES},
+            'chap_single_username': {'type': 'str', 'required': False},
+            'chap_single_password': {'type': 'str', 'required': False,
+                                     'no_log': True},
+            'chap_mutual_username': {'type': 'str', 'required': False},
+            'chap_mutual_password': {'type': 'str', 'required': False,
+                                     'no_log': True}
+        }
+    },
+    'state': {'required': True, 'choices': ('present', 'absent'),
+              'type': 'str'},
+    'initiator_state': {'required': False,
+                        'choices': ('absent-in-host', 'present-in-host'),
+                        'type': 'str'},
+    'new_name': {'required': False, 'type': 'str'},
+    'os_type': {
+        'required': False, 'type': 'str',
+        'choices': ('Windows', 'Linux', 'ESXi', 'AIX', 'HP-UX', 'Solaris')},
+    'host_connectivity': {
+        'required': False, 'type': 'str',
+        'choices': ('Local_Only', 'Metro_Optimize_Both',
+                    'Metro_Optimize_Local', 'Metro_Optimize_Remote')}
+}
 
 
 def get_powerstore_host_parameters():
     """This method provides the parameters required for the ansible host
        module on PowerStore"""
-    return dict(
-        host_name=dict(required=False, type='str'),
-        host_id=dict(required=False, type='str'),
-        initiators=dict(required=False, type='list', elements='str'),
-        detailed_initiators=dict(
-            type='list', required=False, elements='dict',
-            options=dict(port_name=dict(type='str', required=True),
-                         port_type=dict(type='str', required=False,
-                                        choices=PORT_TYPES),
-                         chap_single_username=dict(type='str',
-                                                   required=False),
-                         chap_single_password=dict(type='str',
-                                                   required=False,
-                                                   no_log=True),
-                         chap_mutual_username=dict(type='str',
-                                                   required=False),
-                         chap_mutual_password=dict(type='str',
-                                                   required=False,
-                                                   no_log=True))
-        ),
-        state=dict(required=True, choices=['present', 'absent'],
-                   type='str'),
-        initiator_state=dict(required=False, choices=['absent-in-host',
-                                                      'present-in-host'],
-                             type='str'),
-        new_name=dict(required=False, type='str'),
-        os_type=dict(
-            required=False, type='str',
-            choices=['Windows', 'Linux', 'ESXi', 'AIX', 'HP-UX', 'Solaris']),
-        host_connectivity=dict(
-            required=False, type='str',
-            choices=['Local_Only', 'Metro_Optimize_Both',
-                     'Metro_Optimize_Local', 'Metro_Optimize_Remote'])
-    )
+    return _HOST_ARGSPEC
+
+
+# Argument spec of the module, built once at import
+_MODULE_PARAMS = utils.get_powerstore_management_host_parameters()
+_MODULE_PARAMS.update(get_powerstore_host_parameters())
+MUTUALLY_EXCLUSIVE = [['host_name', 'host_id'],
+                      ['initiators', 'detailed_initiators']]
+REQUIRED_ONE_OF = [['host_name', 'host_id']]
 
 
 def main():
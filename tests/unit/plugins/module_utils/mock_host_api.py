@@ -203,6 +203,14 @@ class MockHostApi:
     def create_host_with_new_name_failed_msg():
         return "Operation on host failed as new_name is given"
 
+    @staticmethod
+    def duplicate_detailed_initiators_failed_msg():
+        return "Duplicate port_name found in detailed_initiators"
+
+    @staticmethod
+    def modify_host_failed_msg():
+        return "Modifying host Sample_host_1 with changes"
+
     @staticmethod
     def modify_os_type_failed_msg():
         return "os_type cannot be modified for an already existing host"
@@ -46,15 +46,27 @@ class TestPowerstoreHost():
         assert self.get_module_args['host_id'] == host_module_mock.module.exit_json.call_args[1]['host_details']['id']
         host_module_mock.conn.provisioning.get_host_details.assert_called()
 
-    def test_get_host_response_by_name(self, host_module_mock):
+    def test_get_host_response_fetches_host_once(self, host_module_mock):
         self.get_module_args.update({
-            'host_name': MockHostApi.HOST_NAME_1,
+            'host_id': "4d56e60-fc10-4f51-a698-84a664562f0d",
             'state': "present"
         })
         host_module_mock.module.params = self.get_module_args
         host_module_mock.conn.provisioning.get_host_details = MagicMock(
             return_value=MockHostApi.HOST_DETAILS)
         host_module_mock.perform_module_operation()
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is False
+        host_module_mock.conn.provisioning.get_host_details.assert_called_once()
+
+    def test_get_host_response_by_name(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': MockHostApi.HOST_NAME_1,
+            'state': "present"
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        host_module_mock.perform_module_operation()
         assert self.get_module_args['host_name'] == host_module_mock.module.exit_json.call_args[1]['host_details']['name']
         host_module_mock.conn.provisioning.get_host_by_name.assert_called()
 
@@ -196,6 +208,48 @@ class TestPowerstoreHost():
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
 
+    def test_create_host_looks_up_name_once(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': "Sample_host_3",
+            'os_type': 'ESXi',
+            'initiators': [self.fc_initiator_1],
+            'detailed_initiators': None,
+            'new_name': None,
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=None)
+        host_module_mock.conn.provisioning.create_host = MagicMock(
+            return_value={'id': MockHostApi.HOST_DETAILS['id']})
+        host_module_mock.conn.provisioning.get_host_details = MagicMock(
+            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.perform_module_operation()
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
+        host_module_mock.conn.provisioning.get_host_by_name.assert_called_once()
+        host_module_mock.conn.provisioning.get_host_details.assert_called_once_with(
+            MockHostApi.HOST_DETAILS['id'])
+
+    def test_create_host_with_duplicate_initiators(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': "Sample_host_3",
+            'os_type': 'ESXi',
+            'initiators': [self.fc_initiator_1, self.fc_initiator_1],
+            'detailed_initiators': None,
+            'new_name': None,
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=None)
+        host_module_mock.conn.provisioning.create_host = MagicMock(
+            return_value={'id': MockHostApi.HOST_DETAILS['id']})
+        host_module_mock.perform_module_operation()
+        assert host_module_mock.conn.provisioning.create_host.call_args[1]['initiators'] == \
+            [{'port_name': self.fc_initiator_1, 'port_type': 'FC'}]
+
     def test_create_host_wo_initiator_state(self, host_module_mock):
         self.get_module_args.update({
             'host_name': "Sample_host_3",
@@ -285,6 +339,22 @@ class TestPowerstoreHost():
         assert MockHostApi.create_host_mixed_initiators_failed_msg() in \
             host_module_mock.module.fail_json.call_args[1]['msg']
 
+    def test_create_host_with_iscsi_and_fc_initiators(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': "Sample_host_3",
+            'os_type': 'ESXi',
+            'initiators': [self.iscsi_initiator_1,
+                           self.fc_initiator_1],
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=None)
+        host_module_mock.perform_module_operation()
+        assert MockHostApi.create_host_mixed_initiators_failed_msg() in \
+            host_module_mock.module.fail_json.call_args[1]['msg']
+
     def test_create_host_without_os_type(self, host_module_mock):
         self.get_module_args.update({
             'host_name': "Sample_host_3",
@@ -321,10 +391,83 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        host_module_mock.perform_module_operation()
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
+
+    def test_add_multiple_initiators_single_modify(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': "Sample_host_1",
+            'initiators': [self.iscsi_initiator_1, self.iscsi_initiator_2],
+            'detailed_initiators': None,
+            'new_name': None,
+            'os_type': None,
+            'host_connectivity': None,
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        host_module_mock.conn.provisioning.modify_host = MagicMock()
+        host_module_mock.perform_module_operation()
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
+        host_module_mock.conn.provisioning.modify_host.assert_called_once()
+        added = host_module_mock.conn.provisioning.modify_host.call_args[1]['add_initiators']
+        assert sorted(init['port_name'] for init in added) == \
+            [self.iscsi_initiator_1, self.iscsi_initiator_2]
+
+    def test_add_initiator_and_rename_single_modify(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': "Sample_host_1",
+            'initiators': [self.iscsi_initiator_2],
+            'detailed_initiators': None,
+            'new_name': "Sample_host_1_new",
+            'os_type': None,
+            'host_connectivity': None,
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        host_module_mock.conn.provisioning.modify_host = MagicMock()
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
+        host_module_mock.conn.provisioning.modify_host.assert_called_once()
+        modify_args = host_module_mock.conn.provisioning.modify_host.call_args[1]
+        assert modify_args['name'] == "Sample_host_1_new"
+        assert [init['port_name'] for init in modify_args['add_initiators']] == \
+            [self.iscsi_initiator_2]
+
+    def test_add_initiator_modify_host_exception(self, host_module_mock, mocker):
+        self.get_module_args.update({
+            'host_name': "Sample_host_1",
+            'initiators': None,
+            'detailed_initiators': [{
+                'port_name': self.iscsi_initiator_2,
+                'port_type': "iSCSI",
+                'chap_single_username': 'chapuserSingle',
+                'chap_single_password': 'chappasswd12345',
+                'chap_mutual_username': None,
+                'chap_mutual_password': None}],
+            'new_name': None,
+            'os_type': None,
+            'host_connectivity': None,
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        mocker.patch.object(host_module_mock.conn.provisioning, 'modify_host',
+                            side_effect=MockApiException)
+        host_module_mock.perform_module_operation()
+        error_msg = host_module_mock.module.fail_json.call_args[1]['msg']
+        assert MockHostApi.modify_host_failed_msg() in error_msg
+        assert self.iscsi_initiator_2 in error_msg
+        assert 'chappasswd12345' not in error_msg
 
     def test_add_iscsi_initiator_detailed_initiator(self, host_module_mock):
         self.get_module_args.update({
@@ -340,11 +483,37 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
 
+    def test_add_duplicate_detailed_initiators(self, host_module_mock):
+        detailed_initiator = {
+            'port_name': self.iscsi_initiator_2,
+            'port_type': "iSCSI",
+            'chap_single_username': None,
+            'chap_single_password': None,
+            'chap_mutual_username': None,
+            'chap_mutual_password': None}
+        self.get_module_args.update({
+            'host_name': "Sample_host_1",
+            'initiators': None,
+            'detailed_initiators': [detailed_initiator,
+                                    dict(detailed_initiator)],
+            'new_name': None,
+            'os_type': None,
+            'host_connectivity': None,
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        host_module_mock.perform_module_operation()
+        assert MockHostApi.duplicate_detailed_initiators_failed_msg() in \
+            host_module_mock.module.fail_json.call_args[1]['msg']
+
     def test_add_nvme_initiator_detailed_initiator(self, host_module_mock):
         self.get_module_args.update({
             'host_name': "Sample_host_1",
@@ -359,8 +528,8 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
         host_module_mock.perform_module_operation()
         host_module_mock.conn.provisioning.modify_host.assert_called()
 
@@ -372,8 +541,8 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS_4)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS_4])
         host_module_mock.perform_module_operation()
         host_module_mock.conn.provisioning.modify_host.assert_called()
 
@@ -391,8 +560,8 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
         host_module_mock.perform_module_operation()
         host_module_mock.conn.provisioning.modify_host.assert_called()
 
@@ -404,8 +573,8 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS_5)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS_5])
         host_module_mock.perform_module_operation()
         host_module_mock.conn.provisioning.modify_host.assert_called()
 
@@ -423,8 +592,8 @@ class TestPowerstoreHost():
             'initiator_state': 'absent-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS_2)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS_2])
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
 
@@ -442,8 +611,8 @@ class TestPowerstoreHost():
             'initiator_state': 'absent-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS_2)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS_2])
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is False
 
@@ -461,8 +630,8 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is False
 
@@ -474,10 +643,28 @@ class TestPowerstoreHost():
             'initiator_state': 'present-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        host_module_mock.perform_module_operation()
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is False
+
+    def test_add_existing_initiator_skips_modify(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': "Sample_host_1",
+            'initiators': ['iqn.1998-01.com.vmware:losat106-0eab2afe'],
+            'detailed_initiators': None,
+            'new_name': None,
+            'host_connectivity': None,
+            'state': 'present',
+            'initiator_state': 'present-in-host'
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
+        host_module_mock.conn.provisioning.modify_host = MagicMock()
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is False
+        host_module_mock.conn.provisioning.modify_host.assert_not_called()
 
     def test_remove_initiator(self, host_module_mock):
         self.get_module_args.update({
@@ -487,8 +674,8 @@ class TestPowerstoreHost():
             'initiator_state': 'absent-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS_2)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS_2])
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
 
@@ -500,8 +687,8 @@ class TestPowerstoreHost():
             'initiator_state': 'absent-in-host'
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS_3)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS_3])
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is False
 
@@ -512,8 +699,8 @@ class TestPowerstoreHost():
             'state': 'present',
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
         host_module_mock.perform_module_operation()
         assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
 
@@ -523,7 +710,21 @@ class TestPowerstoreHost():
             'state': "absent"
         })
         host_module_mock.module.params = self.get_module_args
-        host_module_mock.conn.provisioning.get_host_details = MagicMock(
-            return_value=MockHostApi.HOST_DETAILS)
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[MockHostApi.HOST_DETAILS])
         host_module_mock.perform_module_operation()
         host_module_mock.conn.provisioning.delete_host.assert_called()
+
+    def test_delete_non_existing_host(self, host_module_mock):
+        self.get_module_args.update({
+            'host_name': "Sample_host_6",
+            'state': "absent"
+        })
+        host_module_mock.module.params = self.get_module_args
+        host_module_mock.conn.provisioning.get_host_by_name = MagicMock(
+            return_value=[])
+        host_module_mock.conn.provisioning.delete_host = MagicMock()
+        host_module_mock.perform_module_operation()
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is False
+        assert host_module_mock.module.exit_json.call_args[1]['host_details'] == {}
+        host_module_mock.conn.provisioning.delete_host.assert_not_called()